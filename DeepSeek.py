@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk, messagebox, scrolledtext
 import mysql.connector
 from mysql.connector import Error
+from table_stats import TableStatsCache, TableStatsView
+from sql_completion import SchemaIndex, SqlCompleter
 
 class MySQLGUI:
     def __init__(self, root):
@@ -10,6 +12,9 @@ class MySQLGUI:
         
         # Connection variables
         self.connection = None
+        self.db_params = {}
+        self.stats_cache = TableStatsCache()
+        self.schema_index = SchemaIndex()
         self.host_var = tk.StringVar()
         self.user_var = tk.StringVar()
         self.password_var = tk.StringVar()
@@ -49,6 +54,7 @@ class MySQLGUI:
         # Query input
         self.query_input = scrolledtext.ScrolledText(query_frame, width=60, height=8)
         self.query_input.grid(row=0, column=0, padx=5, pady=5)
+        self.query_completer = SqlCompleter(self.query_input, self.schema_index, self.database_var.get)
 
         # Execute button
         ttk.Button(query_frame, text="Execute", command=self.execute_query).grid(row=1, column=0, pady=5)
@@ -72,6 +78,9 @@ class MySQLGUI:
         scrollbar.grid(row=0, column=1, sticky="ns")
         self.tree.configure(yscrollcommand=scrollbar.set)
 
+        # Statistics button
+        ttk.Button(tree_frame, text="Statistics", command=self.show_statistics).grid(row=1, column=0, pady=5)
+
     def create_result_panel(self):
         # Result Frame
         result_frame = ttk.LabelFrame(self.root, text="Results")
@@ -90,12 +99,15 @@ class MySQLGUI:
 
     def connect(self):
         try:
-            self.connection = mysql.connector.connect(
-                host=self.host_var.get(),
-                user=self.user_var.get(),
-                password=self.password_var.get(),
-                database=self.database_var.get()
-            )
+            self.db_params = {
+                "host": self.host_var.get(),
+                "user": self.user_var.get(),
+                "password": self.password_var.get(),
+                "database": self.database_var.get()
+            }
+            self.connection = mysql.connector.connect(**self.db_params)
+            self.stats_cache.invalidate()
+            self.schema_index.load_async(self.db_params)
             messagebox.showinfo("Success", "Connected to MySQL database!")
             self.populate_database_tree()
         except Error as err:
@@ -128,6 +140,28 @@ class MySQLGUI:
         except Error as err:
             messagebox.showerror("Error", f"Error fetching database structure: {err}")
 
+    def show_statistics(self):
+        if not self.connection:
+            messagebox.showerror("Error", "Not connected to a database")
+            return
+
+        # Use the selected database, or the database of the selected table
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showerror("Error", "No database selected")
+            return
+        item = selection[0]
+        if self.tree.parent(item):
+            item = self.tree.parent(item)
+        db_name = self.tree.item(item, "text")
+
+        stats_window = tk.Toplevel(self.root)
+        stats_window.title(f"Table Statistics - {db_name}")
+        stats_view = TableStatsView(stats_window, self.db_params, db_name, self.stats_cache)
+        stats_view.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
+        stats_window.columnconfigure(0, weight=1)
+        stats_window.rowconfigure(0, weight=1)
+
     def execute_query(self):
         query = self.query_input.get("1.0", tk.END).strip()
         if not query:
@@ -156,6 +190,8 @@ class MySQLGUI:
                     self.result_tree.insert("", "end", values=row)
             else:
                 self.connection.commit()
+                self.stats_cache.invalidate_statement(query, self.database_var.get())
+                self.schema_index.apply_ddl(self.connection, query, self.database_var.get())
                 messagebox.showinfo("Success", f"Query executed successfully. Rows affected: {cursor.rowcount}")
             
             cursor.close()
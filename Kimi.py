@@ -7,6 +7,8 @@ from ttkbootstrap.constants import *
 import logging
 import os, json
 from tkinter import simpledialog, messagebox
+from table_stats import TableStatsCache, TableStatsView
+from sql_completion import SchemaIndex, SqlCompleter
 
 # Configure logging
 logging.basicConfig(filename='app.log', level=logging.INFO, 
@@ -21,6 +23,8 @@ class MySQLAdvancedGUI:
         # Initialize database credentials
         self.db_params = {}
         self.current_database = None
+        self.stats_cache = TableStatsCache()
+        self.schema_index = SchemaIndex()
         self.load_config()
 
         # Create main frame
@@ -44,6 +48,7 @@ class MySQLAdvancedGUI:
             self.create_table_tabs()
             self.create_database_management_frame()
             self.create_cli_tab()
+            self.create_statistics_tab()
 
     def load_config(self):
         """Load database credentials from a config file."""
@@ -99,9 +104,11 @@ class MySQLAdvancedGUI:
                 "database": database_entry.get()
             }
             self.save_config()
+            self.stats_cache.invalidate()
             login_window.destroy()
             self.connect_to_db()
             self.create_table_tabs()
+            self.create_statistics_tab()
 
         submit_btn = tk.Button(login_window, text="Connect", command=submit)
         submit_btn.grid(row=4, column=0, columnspan=2, pady=10)
@@ -111,6 +118,7 @@ class MySQLAdvancedGUI:
         try:
             self.connection = mysql.connector.connect(**self.db_params)
             logging.info("Database connection successful")
+            self.schema_index.load_async(self.db_params)
         except Error as e:
             logging.error(f"Database connection failed: {e}")
 
@@ -143,6 +151,7 @@ class MySQLAdvancedGUI:
                 cursor.execute(f"CREATE DATABASE {db_name}")
                 self.connection.commit()
                 logging.info(f"Database {db_name} created")
+                self.schema_index.add_database(db_name)
                 messagebox.showinfo("Success", f"Database {db_name} created successfully")
                 cursor.close()
             except Error as e:
@@ -162,6 +171,7 @@ class MySQLAdvancedGUI:
                 )
                 self.db_params['database'] = db_name
                 self.save_config()
+                self.stats_cache.invalidate()
                 logging.info(f"Switched to database {db_name}")
                 self.notebook.destroy()
                 self.notebook = ttkb.Notebook(self.main_frame)
@@ -169,6 +179,7 @@ class MySQLAdvancedGUI:
                 self.create_table_tabs()
                 self.create_database_management_frame()
                 self.create_cli_tab()
+                self.create_statistics_tab()
                 messagebox.showinfo("Success", f"Switched to database {db_name}")
             except Error as e:
                 logging.error(f"Error switching database: {e}")
@@ -187,13 +198,16 @@ class MySQLAdvancedGUI:
                 cursor.execute(f"CREATE TABLE {table_name} ({columns})")
                 self.connection.commit()
                 logging.info(f"Table {table_name} created")
+                self.schema_index.refresh_table(self.connection, self.db_params.get('database'), table_name)
                 messagebox.showinfo("Success", f"Table {table_name} created successfully")
+                self.stats_cache.invalidate(self.db_params.get('database'))
                 self.notebook.destroy()
                 self.notebook = ttkb.Notebook(self.main_frame)
                 self.notebook.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S), padx=10, pady=10)
                 self.create_table_tabs()
                 self.create_database_management_frame()
                 self.create_cli_tab()
+                self.create_statistics_tab()
                 cursor.close()
             except Error as e:
                 logging.error(f"Error creating table: {e}")
@@ -211,6 +225,8 @@ class MySQLAdvancedGUI:
                 cursor.execute(f"ALTER TABLE {table_name} ADD COLUMN {column_def}")
                 self.connection.commit()
                 logging.info(f"Column {column_def} added to {table_name}")
+                self.stats_cache.invalidate(self.db_params.get('database'))
+                self.schema_index.refresh_table(self.connection, self.db_params.get('database'), table_name)
                 messagebox.showinfo("Success", f"Column {column_def} added to {table_name} successfully")
                 self.refresh_data(table_name)
                 cursor.close()
@@ -231,6 +247,8 @@ class MySQLAdvancedGUI:
                 cursor.execute(f"ALTER TABLE {table_name} MODIFY COLUMN {column_def}")
                 self.connection.commit()
                 logging.info(f"Column {column_def} modified in {table_name}")
+                self.stats_cache.invalidate(self.db_params.get('database'))
+                self.schema_index.refresh_table(self.connection, self.db_params.get('database'), table_name)
                 messagebox.showinfo("Success", f"Column {column_def} modified in {table_name} successfully")
                 self.refresh_data(table_name)
                 cursor.close()
@@ -250,6 +268,8 @@ class MySQLAdvancedGUI:
                 cursor.execute(f"ALTER TABLE {table_name} DROP COLUMN {column_name}")
                 self.connection.commit()
                 logging.info(f"Column {column_name} dropped from {table_name}")
+                self.stats_cache.invalidate(self.db_params.get('database'))
+                self.schema_index.refresh_table(self.connection, self.db_params.get('database'), table_name)
                 messagebox.showinfo("Success", f"Column {column_name} dropped from {table_name} successfully")
                 self.refresh_data(table_name)
                 cursor.close()
@@ -292,6 +312,8 @@ class MySQLAdvancedGUI:
         # Command Entry
         self.cli_entry = ttkb.Entry(cli_frame)
         self.cli_entry.grid(row=0, column=0, padx=5, pady=5, sticky='ew')
+        self.cli_completer = SqlCompleter(self.cli_entry, self.schema_index,
+                                          lambda: self.db_params.get('database'))
 
         # Execute Button
         execute_btn = ttkb.Button(cli_frame, text="Execute", command=self.execute_cli_command)
@@ -303,6 +325,12 @@ class MySQLAdvancedGUI:
         cli_frame.columnconfigure(0, weight=1)
         cli_frame.rowconfigure(1, weight=1)
 
+    def create_statistics_tab(self):
+        """Create a tab showing estimated size statistics for each table"""
+        stats_frame = TableStatsView(self.notebook, self.db_params, self.db_params.get('database'),
+                                     self.stats_cache, padding=10)
+        self.notebook.add(stats_frame, text="Statistics")
+
     def execute_cli_command(self):
         """Execute the entered SQL command"""
         command = self.cli_entry.get()
@@ -316,6 +344,8 @@ class MySQLAdvancedGUI:
                     self.cli_output.insert(tk.END, str(result))
                 else:
                     self.connection.commit()
+                    self.stats_cache.invalidate_statement(command, self.db_params.get('database'))
+                    self.schema_index.apply_ddl(self.connection, command, self.db_params.get('database'))
                     self.cli_output.delete('1.0', tk.END)
                     self.cli_output.insert(tk.END, f"Command executed successfully: {command}")
                 logging.info(f"Executed CLI command: {command}")
@@ -0,0 +1,507 @@
+import re
+import logging
+import threading
+import tkinter as tk
+from bisect import bisect_left, insort
+import mysql.connector
+from mysql.connector import Error
+
+SQL_KEYWORDS = (
+    "ADD", "ALL", "ALTER", "AND", "AS", "ASC", "AUTO_INCREMENT", "BETWEEN", "BIGINT",
+    "BY", "CASE", "CHANGE", "CHAR", "COLUMN", "COLUMNS", "COUNT", "CREATE", "CROSS",
+    "DATABASE", "DATABASES", "DATE", "DATETIME", "DECIMAL", "DEFAULT", "DELETE", "DESC",
+    "DESCRIBE", "DISTINCT", "DOUBLE", "DROP", "ELSE", "END", "EXISTS", "EXPLAIN", "FALSE",
+    "FLOAT", "FOREIGN", "FROM", "FULL", "GROUP", "HAVING", "IF", "IGNORE", "IN", "INDEX",
+    "INNER", "INSERT", "INT", "INTEGER", "INTO", "IS", "JOIN", "KEY", "LEFT", "LIKE", "LIMIT",
+    "MODIFY", "NOT", "NULL", "OFFSET", "ON", "OR", "ORDER", "OUTER", "PRIMARY", "REFERENCES",
+    "RENAME", "REPLACE", "RIGHT", "SCHEMA", "SELECT", "SET", "SHOW", "TABLE", "TABLES",
+    "TEXT", "THEN", "TIMESTAMP", "TINYINT", "TO", "TRUE", "TRUNCATE", "UNION", "UNIQUE",
+    "UNSIGNED", "UPDATE", "USE", "USING", "VALUES", "VARCHAR", "WHEN", "WHERE", "WITH",
+)
+
+# Words that end a table reference rather than naming its alias
+CLAUSE_WORDS = (
+    "WHERE", "JOIN", "INNER", "LEFT", "RIGHT", "CROSS", "NATURAL", "STRAIGHT_JOIN", "FULL",
+    "OUTER", "ON", "USING", "GROUP", "ORDER", "LIMIT", "HAVING", "SET", "VALUES", "VALUE",
+    "SELECT", "UNION", "WINDOW", "FOR", "LOCK", "PARTITION", "USE", "FORCE", "IGNORE",
+    "INTO", "ADD", "DROP", "MODIFY", "CHANGE", "ALTER", "RENAME", "TO",
+)
+
+IDENT = r"(?:`[^`]+`|\w+)"
+QUALIFIED = rf"{IDENT}(?:\s*\.\s*{IDENT})?"
+TABLE_ALIAS = rf"(?:\s+(?:AS\s+)?(?!(?:{'|'.join(CLAUSE_WORDS)})\b){IDENT})?"
+TABLE_REFS_RE = re.compile(
+    rf"\b(?:FROM|JOIN|UPDATE|INTO|TABLE)\s+({QUALIFIED}{TABLE_ALIAS}(?:\s*,\s*{QUALIFIED}{TABLE_ALIAS})*)",
+    re.IGNORECASE)
+TABLE_REF_RE = re.compile(rf"\s*({IDENT})(?:\s*\.\s*({IDENT}))?(?:\s+(?:AS\s+)?({IDENT}))?\s*$", re.IGNORECASE)
+TOKEN_RE = re.compile(r"(?:(`[^`]*`|\w+)\.)?`?(\w*)$")
+
+DATABASE_DDL_RE = re.compile(
+    rf"^\s*(CREATE|DROP)\s+(?:DATABASE|SCHEMA)\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?({IDENT})", re.IGNORECASE)
+TABLE_DDL_RE = re.compile(
+    r"^\s*(?:CREATE|ALTER|DROP|RENAME|TRUNCATE)\s+(?:TEMPORARY\s+)?TABLES?\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?(.*)$",
+    re.IGNORECASE | re.DOTALL)
+RENAMED_TABLE_RE = re.compile(
+    rf"\bRENAME\s+(?:(?:TO|AS)\s+)?(?!(?:COLUMN|INDEX|KEY)\b)({QUALIFIED})", re.IGNORECASE)
+
+TABLE_CONTEXT_WORDS = ("FROM", "JOIN", "INTO", "UPDATE", "TABLE", "DESCRIBE", "DESC", "TRUNCATE")
+
+MAX_SUGGESTIONS = 50
+
+# Only text this close to the cursor is scanned on each keystroke
+TOKEN_WINDOW = 256
+STATEMENT_WINDOW = 4096
+
+
+def strip_identifier(name):
+    """Remove backtick quoting from an identifier"""
+    name = name.strip()
+    if name.startswith("`") and name.endswith("`") and len(name) > 1:
+        return name[1:-1].replace("``", "`")
+    return name
+
+
+def split_qualified(name, default_schema):
+    """Split ``schema.table`` into its parts, falling back to the default schema"""
+    parts = [strip_identifier(part) for part in re.findall(IDENT, name)]
+    if len(parts) == 2:
+        return parts[0], parts[1]
+    return default_schema, parts[0]
+
+
+class PrefixIndex:
+    """Sorted, case-insensitive name index searched with bisect.
+
+    Names are reference counted so that a column name shared by many
+    tables stays in the index until the last of them is removed.
+    """
+
+    def __init__(self, names=()):
+        self._counts = {}
+        for name in names:
+            self._counts[name] = self._counts.get(name, 0) + 1
+        self._keys = sorted((name.lower(), name) for name in self._counts)
+
+    def __len__(self):
+        return len(self._keys)
+
+    def __contains__(self, name):
+        return name in self._counts
+
+    def __iter__(self):
+        return (name for _, name in self._keys)
+
+    def add(self, name):
+        if name in self._counts:
+            self._counts[name] += 1
+            return
+        self._counts[name] = 1
+        insort(self._keys, (name.lower(), name))
+
+    def remove(self, name):
+        count = self._counts.get(name)
+        if count is None:
+            return
+        if count > 1:
+            self._counts[name] = count - 1
+            return
+        del self._counts[name]
+        key = (name.lower(), name)
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            del self._keys[i]
+
+    def search(self, prefix, limit=MAX_SUGGESTIONS):
+        """Return up to ``limit`` names starting with ``prefix``"""
+        prefix = prefix.lower()
+        keys = self._keys
+        i = bisect_left(keys, (prefix,))
+        matches = []
+        while i < len(keys) and len(matches) < limit and keys[i][0].startswith(prefix):
+            matches.append(keys[i][1])
+            i += 1
+        return matches
+
+
+class SchemaIndex:
+    """Prefix indexes over keywords, databases, tables and columns.
+
+    Built once from information_schema and kept current by feeding
+    executed DDL statements to ``apply_ddl``.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.keywords = PrefixIndex(SQL_KEYWORDS)
+        self.databases = PrefixIndex()
+        self.tables = {}
+        self.columns = {}
+        self.all_columns = PrefixIndex()
+        self._generation = 0
+        self._loads = {}
+
+    def load(self, connection):
+        """Rebuild every index from information_schema.
+
+        Only the most recently started load is swapped in; older loads
+        that finish later are discarded.
+        """
+        with self._lock:
+            self._generation += 1
+            generation = self._generation
+            self._loads[generation] = []
+        cursor = connection.cursor()
+        try:
+            cursor.execute("SELECT SCHEMA_NAME FROM information_schema.SCHEMATA")
+            databases = [row[0] for row in cursor.fetchall()]
+            cursor.execute(
+                "SELECT TABLE_SCHEMA, TABLE_NAME, COLUMN_NAME FROM information_schema.COLUMNS "
+                "ORDER BY TABLE_SCHEMA, TABLE_NAME, ORDINAL_POSITION")
+            table_names = {}
+            column_names = {}
+            for schema, table, column in cursor:
+                key = (schema.lower(), table.lower())
+                if key not in column_names:
+                    column_names[key] = []
+                    table_names.setdefault(key[0], []).append(table)
+                column_names[key].append(column)
+        except Error:
+            with self._lock:
+                self._loads.pop(generation, None)
+            raise
+        finally:
+            cursor.close()
+
+        # Sort once per index instead of inserting names one at a time
+        tables = {schema: PrefixIndex(names) for schema, names in table_names.items()}
+        columns = {key: PrefixIndex(names) for key, names in column_names.items()}
+        all_columns = PrefixIndex(column for names in column_names.values() for column in names)
+        with self._lock:
+            pending = self._loads.pop(generation, [])
+            if generation != self._generation:
+                return
+            self.databases = PrefixIndex(databases)
+            self.tables = tables
+            self.columns = columns
+            self.all_columns = all_columns
+            # Replay DDL applied to the old indexes while the snapshot was read
+            for change in pending:
+                change()
+
+    def load_async(self, db_params):
+        """Load the index on its own connection in a background thread"""
+        def worker():
+            connection = None
+            try:
+                connection = mysql.connector.connect(**db_params)
+                self.load(connection)
+            except Error as err:
+                logging.error(f"Failed to load schema index: {err}")
+            finally:
+                if connection is not None:
+                    connection.close()
+
+        thread = threading.Thread(target=worker, daemon=True)
+        thread.start()
+        return thread
+
+    def _apply(self, change):
+        """Apply a change now, and again once a running load has swapped in its snapshot"""
+        with self._lock:
+            change()
+            for pending in self._loads.values():
+                pending.append(change)
+
+    def add_database(self, schema):
+        self._apply(lambda: self._add_database(schema))
+
+    def _add_database(self, schema):
+        if schema not in self.databases:
+            self.databases.add(schema)
+
+    def drop_database(self, schema):
+        self._apply(lambda: self._drop_database(schema))
+
+    def _drop_database(self, schema):
+        for name in self.databases.search(schema, len(self.databases)):
+            if name.lower() == schema.lower():
+                self.databases.remove(name)
+        tables = self.tables.pop(schema.lower(), None)
+        for table in tables or ():
+            for column in self.columns.pop((schema.lower(), table.lower()), ()):
+                self.all_columns.remove(column)
+
+    def drop_table(self, schema, table):
+        self._apply(lambda: self._drop_table(schema, table))
+
+    def _drop_table(self, schema, table):
+        tables = self.tables.get(schema.lower())
+        if tables is not None:
+            for name in [name for name in tables if name.lower() == table.lower()]:
+                tables.remove(name)
+        for column in self.columns.pop((schema.lower(), table.lower()), ()):
+            self.all_columns.remove(column)
+
+    def refresh_table(self, connection, schema, table):
+        """Re-read one table's columns, dropping it if it no longer exists"""
+        cursor = connection.cursor()
+        try:
+            cursor.execute(
+                "SELECT TABLE_NAME, COLUMN_NAME FROM information_schema.COLUMNS "
+                "WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s ORDER BY ORDINAL_POSITION",
+                (schema, table))
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+        self._apply(lambda: self._set_table(schema, table, rows))
+
+    def _set_table(self, schema, table, rows):
+        self._drop_table(schema, table)
+        if not rows:
+            return
+        self.tables.setdefault(schema.lower(), PrefixIndex()).add(rows[0][0])
+        columns = [row[1] for row in rows]
+        self.columns[(schema.lower(), table.lower())] = PrefixIndex(columns)
+        for column in columns:
+            self.all_columns.add(column)
+
+    def apply_ddl(self, connection, statement, default_schema):
+        """Update the index for the tables and databases a DDL statement touched.
+
+        Failures are logged rather than raised, since the statement itself
+        has already succeeded.
+        """
+        for part in statement.split(";"):
+            match = DATABASE_DDL_RE.match(part)
+            if match:
+                schema = strip_identifier(match.group(2))
+                if match.group(1).upper() == "CREATE":
+                    self.add_database(schema)
+                else:
+                    self.drop_database(schema)
+                continue
+
+            match = TABLE_DDL_RE.match(part)
+            if not match or not default_schema and "." not in match.group(1):
+                continue
+            body = match.group(1)
+            names = [m.group(0) for m in re.finditer(QUALIFIED, body.split("(")[0])]
+            if part.strip().upper().startswith("ALTER"):
+                names = names[:1] + RENAMED_TABLE_RE.findall(body)
+            elif part.strip().upper().startswith(("CREATE", "TRUNCATE")):
+                names = names[:1]
+            else:
+                # DROP TABLE a, b / RENAME TABLE a TO b, c TO d
+                names = [name for name in names if name.upper() not in ("TO", "RESTRICT", "CASCADE")]
+            for name in names:
+                schema, table = split_qualified(name, default_schema)
+                if schema:
+                    try:
+                        self.refresh_table(connection, schema, table)
+                    except Error as err:
+                        logging.error(f"Failed to refresh schema index for {schema}.{table}: {err}")
+
+    def table_columns(self, schema, table):
+        return self.columns.get(((schema or "").lower(), table.lower()))
+
+    def complete(self, text_before, text_after, default_schema, limit=MAX_SUGGESTIONS):
+        """Suggest completions for the word ending at the cursor.
+
+        Returns the typed prefix and a list of candidate replacements.
+        """
+        statement_before = text_before[-STATEMENT_WINDOW:].rsplit(";", 1)[-1]
+        statement = statement_before + text_after[:STATEMENT_WINDOW].split(";", 1)[0]
+        tail = statement_before[-TOKEN_WINDOW:]
+        match = TOKEN_RE.search(tail)
+        qualifier = match.group(1)
+        prefix = match.group(2)
+        previous = re.findall(r"\w+", tail[:match.start()])
+        previous = previous[-1].upper() if previous else ""
+
+        references = {}
+        for refs in TABLE_REFS_RE.finditer(statement):
+            for ref in refs.group(1).split(","):
+                parts = TABLE_REF_RE.match(ref)
+                if not parts:
+                    continue
+                if parts.group(2):
+                    schema, table = strip_identifier(parts.group(1)), strip_identifier(parts.group(2))
+                else:
+                    schema, table = default_schema, strip_identifier(parts.group(1))
+                references.setdefault(table.lower(), (schema, table))
+                if parts.group(3):
+                    references[strip_identifier(parts.group(3)).lower()] = (schema, table)
+
+        if qualifier:
+            qualifier = strip_identifier(qualifier)
+            if qualifier.lower() in references:
+                columns = self.table_columns(*references[qualifier.lower()])
+            else:
+                columns = self.table_columns(default_schema, qualifier)
+            if columns is not None:
+                return prefix, columns.search(prefix, limit)
+            tables = self.tables.get(qualifier.lower())
+            return prefix, tables.search(prefix, limit) if tables is not None else []
+
+        if previous == "USE":
+            return prefix, self.databases.search(prefix, limit)
+
+        if previous in TABLE_CONTEXT_WORDS:
+            tables = self.tables.get((default_schema or "").lower())
+            suggestions = tables.search(prefix, limit) if tables is not None else []
+            return prefix, suggestions + self.databases.search(prefix, limit - len(suggestions))
+
+        suggestions = [name for name in references if name.startswith(prefix.lower())]
+        for schema, table in set(references.values()):
+            columns = self.table_columns(schema, table)
+            if columns is not None:
+                suggestions.extend(columns.search(prefix, limit))
+        if not references:
+            suggestions.extend(self.all_columns.search(prefix, limit))
+        suggestions.extend(self.keywords.search(prefix, limit))
+        return prefix, list(dict.fromkeys(suggestions))[:limit]
+
+
+class SqlCompleter:
+    """Completion popup for a Text or Entry widget backed by a SchemaIndex"""
+
+    WORD_KEYS = ("BackSpace", "period", "underscore")
+    IGNORED_KEYS = ("Up", "Down", "Return", "Tab", "Escape", "Shift_L", "Shift_R", "Control_L",
+                    "Control_R", "Alt_L", "Alt_R", "Meta_L", "Meta_R", "Super_L", "Super_R",
+                    "Caps_Lock", "ISO_Level3_Shift")
+
+    def __init__(self, widget, index, get_schema):
+        self.widget = widget
+        self.index = index
+        self.get_schema = get_schema
+        self.prefix = ""
+        self.popup = None
+        self.listbox = None
+        self.navigated = False
+        self.chord = False
+
+        widget.bind("<KeyRelease>", self.on_key_release, add="+")
+        widget.bind("<Control-space>", self.on_control_space)
+        widget.bind("<Down>", lambda event: self.move(1))
+        widget.bind("<Up>", lambda event: self.move(-1))
+        widget.bind("<Tab>", self.accept)
+        widget.bind("<Return>", self.on_return, add="+")
+        widget.bind("<Escape>", lambda event: self.hide())
+        widget.bind("<FocusOut>", lambda event: widget.after(150, self.hide_unless_focused))
+
+    def is_visible(self):
+        return self.popup is not None and self.popup.winfo_ismapped()
+
+    def text_around_cursor(self):
+        if isinstance(self.widget, tk.Text):
+            return (self.widget.get(f"insert-{STATEMENT_WINDOW}c", "insert"),
+                    self.widget.get("insert", f"insert+{STATEMENT_WINDOW}c"))
+        text = self.widget.get()
+        cursor = self.widget.index("insert")
+        return text[:cursor], text[cursor:]
+
+    def on_control_space(self, event):
+        self.chord = True
+        self.update(force=True)
+        return "break"
+
+    def on_key_release(self, event):
+        if event.keysym in self.IGNORED_KEYS:
+            return
+        if event.keysym == "space" and self.chord:
+            # Release that ends the Control-space chord which opened the popup
+            self.chord = False
+            return
+        if event.keysym in self.WORD_KEYS or (event.char and (event.char.isalnum() or event.char in "_.`")):
+            self.update()
+        else:
+            self.hide()
+
+    def update(self, force=False):
+        """Refresh the suggestion list for the word at the cursor"""
+        before, after = self.text_around_cursor()
+        self.prefix, suggestions = self.index.complete(before, after, self.get_schema())
+        if not suggestions or not (force or self.prefix or before.endswith(".")):
+            self.hide()
+            return
+        if len(suggestions) == 1 and suggestions[0] == self.prefix:
+            self.hide()
+            return
+        self.show(suggestions)
+
+    def show(self, suggestions):
+        if self.popup is None:
+            self.popup = tk.Toplevel(self.widget)
+            self.popup.overrideredirect(True)
+            self.listbox = tk.Listbox(self.popup, height=10, exportselection=False, takefocus=0)
+            self.listbox.pack(fill="both", expand=True)
+            self.listbox.bind("<ButtonRelease-1>", self.accept)
+
+        self.listbox.delete(0, tk.END)
+        for suggestion in suggestions:
+            self.listbox.insert(tk.END, suggestion)
+        self.listbox.configure(height=min(len(suggestions), 10))
+        self.listbox.selection_set(0)
+        self.navigated = False
+
+        if isinstance(self.widget, tk.Text):
+            bbox = self.widget.bbox("insert")
+        else:
+            bbox = self.widget.bbox(self.widget.index("insert"))
+        x, y = self.widget.winfo_rootx(), self.widget.winfo_rooty()
+        if bbox:
+            x, y = x + bbox[0], y + bbox[1] + bbox[3]
+        else:
+            y += self.widget.winfo_height()
+        self.popup.geometry(f"+{x}+{y}")
+        self.popup.deiconify()
+        self.popup.lift()
+
+    def hide(self):
+        if self.popup is not None:
+            self.popup.withdraw()
+
+    def hide_unless_focused(self):
+        if self.listbox is None or self.widget.focus_get() is not self.listbox:
+            self.hide()
+
+    def move(self, step):
+        if not self.is_visible():
+            return None
+        selection = self.listbox.curselection()
+        current = selection[0] if selection else 0
+        new = max(0, min(self.listbox.size() - 1, current + step))
+        self.listbox.selection_clear(0, tk.END)
+        self.listbox.selection_set(new)
+        self.listbox.see(new)
+        self.navigated = True
+        return "break"
+
+    def on_return(self, event):
+        """Accept on Return, except in a Text widget where it normally starts a new line"""
+        if isinstance(self.widget, tk.Text) and not self.navigated:
+            self.hide()
+            return None
+        return self.accept(event)
+
+    def accept(self, event=None):
+        """Replace the word at the cursor with the selected suggestion"""
+        if not self.is_visible():
+            return None
+        selection = self.listbox.curselection()
+        if not selection:
+            self.hide()
+            return None
+        word = self.listbox.get(selection[0])
+        count = len(self.prefix)
+        if isinstance(self.widget, tk.Text):
+            self.widget.delete(f"insert-{count}c", "insert")
+            self.widget.insert("insert", word)
+        else:
+            cursor = self.widget.index("insert")
+            self.widget.delete(cursor - count, cursor)
+            self.widget.insert(cursor - count, word)
+        self.hide()
+        self.widget.focus_set()
+        return "break"
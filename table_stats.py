@@ -0,0 +1,426 @@
+import re
+import threading
+import time
+import queue
+from tkinter import ttk, messagebox
+import mysql.connector
+from mysql.connector import Error
+
+# One round trip for every table in a schema. TABLE_ROWS and the length columns
+# are the storage engine's estimates, so this never touches the table data.
+STATS_QUERY = """
+    SELECT t.TABLE_NAME, t.ENGINE, t.TABLE_ROWS, t.DATA_LENGTH, t.INDEX_LENGTH,
+           t.DATA_FREE, t.AUTO_INCREMENT, c.COLUMN_TYPE
+    FROM information_schema.TABLES t
+    LEFT JOIN information_schema.COLUMNS c
+        ON c.TABLE_SCHEMA = t.TABLE_SCHEMA
+        AND c.TABLE_NAME = t.TABLE_NAME
+        AND LOCATE('auto_increment', c.EXTRA) > 0
+    WHERE t.TABLE_SCHEMA = %s AND t.TABLE_TYPE = 'BASE TABLE'
+    ORDER BY t.TABLE_NAME
+"""
+
+PRIMARY_KEY_QUERY = """
+    SELECT COLUMN_NAME
+    FROM information_schema.KEY_COLUMN_USAGE
+    WHERE TABLE_SCHEMA = %s AND TABLE_NAME = %s AND CONSTRAINT_NAME = 'PRIMARY'
+    ORDER BY ORDINAL_POSITION
+"""
+
+INTEGER_MAX = {
+    "tinyint": (127, 255),
+    "smallint": (32767, 65535),
+    "mediumint": (8388607, 16777215),
+    "int": (2147483647, 4294967295),
+    "integer": (2147483647, 4294967295),
+    "bigint": (9223372036854775807, 18446744073709551615),
+}
+
+EXACT_COUNT_CHUNK = 10000
+
+DDL_RE = re.compile(r"^\s*(?:CREATE|ALTER|DROP|RENAME|TRUNCATE)\b", re.IGNORECASE)
+DATABASE_DDL_RE = re.compile(
+    r"^\s*(?:CREATE|DROP)\s+(?:DATABASE|SCHEMA)\s+(?:IF\s+(?:NOT\s+)?EXISTS\s+)?(`[^`]+`|\w+)", re.IGNORECASE)
+QUALIFIED_NAME_RE = re.compile(r"(`[^`]+`|\w+)\s*\.\s*(?:`[^`]+`|\w+)")
+
+
+def quote_identifier(name):
+    """Quote a MySQL identifier with backticks"""
+    return "`" + str(name).replace("`", "``") + "`"
+
+
+def format_bytes(size):
+    """Format a byte count for display"""
+    if size is None:
+        return ""
+    size = float(size)
+    for unit in ("B", "KB", "MB", "GB", "TB"):
+        if size < 1024 or unit == "TB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+def fragmentation_percent(data_length, index_length, data_free):
+    """Share of the allocated space that is free, or None if unknown"""
+    if not data_free:
+        return None if data_free is None else 0.0
+    total = (data_length or 0) + (index_length or 0) + data_free
+    return 100.0 * data_free / total
+
+
+def auto_increment_used_percent(column_type, auto_increment):
+    """Share of the auto-increment column's range already consumed"""
+    if not column_type or not auto_increment:
+        return None
+    base = column_type.lower().split("(")[0].split()[0]
+    if base not in INTEGER_MAX:
+        return None
+    signed_max, unsigned_max = INTEGER_MAX[base]
+    max_value = unsigned_max if "unsigned" in column_type.lower() else signed_max
+    return 100.0 * (auto_increment - 1) / max_value
+
+
+def ddl_schemas(statement, default_schema):
+    """Schemas whose tables a statement may have created, dropped or resized"""
+    schemas = set()
+    for part in statement.split(";"):
+        if not DDL_RE.match(part):
+            continue
+        match = DATABASE_DDL_RE.match(part)
+        if match:
+            schemas.add(match.group(1).strip("`"))
+            continue
+        if default_schema:
+            schemas.add(default_schema)
+        schemas.update(name.strip("`") for name in QUALIFIED_NAME_RE.findall(part))
+    return schemas
+
+
+def fetch_table_stats(connection, schema, refresh=False):
+    """Fetch estimated statistics for every table in a schema.
+
+    MySQL 8 serves information_schema.TABLES from cached statistics that
+    can be up to a day old; ``refresh`` asks the server to bypass them.
+    """
+    cursor = connection.cursor()
+    expiry = None
+    try:
+        if refresh:
+            try:
+                cursor.execute("SELECT @@SESSION.information_schema_stats_expiry")
+                expiry = cursor.fetchone()[0]
+                cursor.execute("SET SESSION information_schema_stats_expiry = 0")
+            except Error:
+                # MySQL 5.7 and MariaDB have no such variable and never cache
+                expiry = None
+        cursor.execute(STATS_QUERY, (schema,))
+        stats = []
+        for (name, engine, rows, data_length, index_length,
+             data_free, auto_increment, column_type) in cursor.fetchall():
+            stats.append({
+                "table": name,
+                "engine": engine,
+                "rows": rows,
+                "data_length": data_length,
+                "index_length": index_length,
+                "data_free": data_free,
+                "fragmentation": fragmentation_percent(data_length, index_length, data_free),
+                "auto_increment_used": auto_increment_used_percent(column_type, auto_increment),
+            })
+        return stats
+    finally:
+        if expiry is not None:
+            cursor.execute("SET SESSION information_schema_stats_expiry = %s", (expiry,))
+        cursor.close()
+
+
+def count_rows_chunked(connection, schema, table, chunk_size=EXACT_COUNT_CHUNK, cancel=None):
+    """Count rows exactly by walking the primary key in bounded ranges.
+
+    Each chunk is its own short statement, so no single read holds a
+    snapshot or metadata lock for the length of the whole scan. Tables
+    without a primary key fall back to a plain COUNT(*).
+    """
+    cursor = connection.cursor()
+    try:
+        cursor.execute(PRIMARY_KEY_QUERY, (schema, table))
+        pk = [row[0] for row in cursor.fetchall()]
+        target = f"{quote_identifier(schema)}.{quote_identifier(table)}"
+
+        if not pk:
+            cursor.execute(f"SELECT COUNT(*) FROM {target}")
+            return cursor.fetchone()[0]
+
+        cols = ", ".join(quote_identifier(col) for col in pk)
+        key = f"({cols})"
+        placeholders = "(" + ", ".join(["%s"] * len(pk)) + ")"
+        total = 0
+        last = None
+        while True:
+            if cancel is not None and cancel.is_set():
+                return None
+
+            lower, params = "", ()
+            if last is not None:
+                lower, params = f"WHERE {key} > {placeholders}", tuple(last)
+
+            # Find the key at the end of this chunk, then count up to it
+            cursor.execute(
+                f"SELECT {cols} FROM {target} {lower} ORDER BY {cols} LIMIT 1 OFFSET %s",
+                params + (chunk_size - 1,))
+            bound = cursor.fetchone()
+
+            if bound is None:
+                cursor.execute(f"SELECT COUNT(*) FROM {target} {lower}", params)
+                return total + cursor.fetchone()[0]
+
+            upper = f"{key} <= {placeholders}"
+            where = f"{lower} AND {upper}" if lower else f"WHERE {upper}"
+            cursor.execute(f"SELECT COUNT(*) FROM {target} {where}", params + tuple(bound))
+            total += cursor.fetchone()[0]
+            last = bound
+    finally:
+        cursor.close()
+
+
+def start_stats_worker(db_params, jobs, results, cancel, chunk_size=EXACT_COUNT_CHUNK):
+    """Serve statistics jobs from one background thread on one connection.
+
+    Jobs are ``("estimates", schema, refresh)`` or ``("count", schema, table)``
+    and each outcome is put on ``results`` as ``(job, value, error)``; the
+    caller is expected to drain that queue from the Tk main loop. The thread
+    exits when it reads ``None`` from ``jobs`` or ``cancel`` is set.
+    """
+    params = {key: value for key, value in db_params.items() if key != "database"}
+
+    def worker():
+        connection = None
+        try:
+            while True:
+                job = jobs.get()
+                if job is None or cancel.is_set():
+                    break
+                try:
+                    if connection is None:
+                        connection = mysql.connector.connect(**params)
+                        connection.autocommit = True
+                    if job[0] == "estimates":
+                        value = fetch_table_stats(connection, job[1], job[2])
+                    else:
+                        value = count_rows_chunked(connection, job[1], job[2], chunk_size, cancel)
+                    results.put((job, value, None))
+                except Error as err:
+                    results.put((job, None, err))
+                    # Reconnect for the next job rather than reuse a broken session
+                    if connection is not None:
+                        try:
+                            connection.close()
+                        except Error:
+                            pass
+                        connection = None
+        finally:
+            if connection is not None:
+                connection.close()
+
+    thread = threading.Thread(target=worker, daemon=True)
+    thread.start()
+    return thread
+
+
+class TableStatsCache:
+    """Timestamped estimates and exact counts, shared between views"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._estimates = {}
+        self._exact = {}
+
+    def get_estimates(self, schema):
+        with self._lock:
+            return self._estimates.get(schema)
+
+    def set_estimates(self, schema, stats):
+        with self._lock:
+            self._estimates[schema] = (time.time(), stats)
+
+    def get_exact(self, schema, table):
+        with self._lock:
+            return self._exact.get((schema, table))
+
+    def set_exact(self, schema, table, count):
+        with self._lock:
+            self._exact[(schema, table)] = (time.time(), count)
+
+    def invalidate(self, schema=None):
+        with self._lock:
+            if schema is None:
+                self._estimates.clear()
+                self._exact.clear()
+            else:
+                for key in [key for key in self._estimates if key.lower() == schema.lower()]:
+                    del self._estimates[key]
+                for key in [key for key in self._exact if key[0].lower() == schema.lower()]:
+                    del self._exact[key]
+
+    def invalidate_statement(self, statement, default_schema):
+        """Drop cached statistics for every schema a DDL statement touched"""
+        for schema in ddl_schemas(statement, default_schema):
+            self.invalidate(schema)
+
+
+class TableStatsView(ttk.Frame):
+    """Treeview of per-table statistics for a single schema"""
+
+    COLUMNS = ("engine", "rows", "data", "index", "free", "fragmentation",
+               "auto_increment", "exact", "counted_at")
+    HEADINGS = ("Engine", "Est. Rows", "Data", "Index", "Free", "Frag %",
+                "AI Used %", "Exact Rows", "Counted At")
+
+    def __init__(self, parent, db_params, schema, cache, **kwargs):
+        super().__init__(parent, **kwargs)
+        self.db_params = db_params
+        self.schema = schema
+        self.cache = cache
+        self.jobs = queue.Queue()
+        self.results = queue.Queue()
+        self.cancel = threading.Event()
+        self.worker = None
+        self.pending = set()
+        self.loading = False
+        self.poll_id = None
+
+        self.status_label = ttk.Label(self, text="")
+        self.status_label.grid(row=0, column=0, columnspan=2, sticky="w", padx=5, pady=5)
+
+        self.tree = ttk.Treeview(self, columns=self.COLUMNS)
+        self.tree.heading("#0", text="Table")
+        self.tree.column("#0", width=160)
+        for col, heading in zip(self.COLUMNS, self.HEADINGS):
+            self.tree.heading(col, text=heading)
+            self.tree.column(col, width=90, anchor="e")
+        self.tree.grid(row=1, column=0, sticky="nsew")
+
+        scrollbar = ttk.Scrollbar(self, orient="vertical", command=self.tree.yview)
+        scrollbar.grid(row=1, column=1, sticky="ns")
+        self.tree.configure(yscrollcommand=scrollbar.set)
+
+        button_frame = ttk.Frame(self)
+        button_frame.grid(row=2, column=0, columnspan=2, sticky="w", pady=5)
+        ttk.Button(button_frame, text="Refresh Estimates",
+                   command=lambda: self.load_estimates(refresh=True)).grid(row=0, column=0, padx=5)
+        ttk.Button(button_frame, text="Exact Count (Selected)",
+                   command=self.count_selected).grid(row=0, column=1, padx=5)
+
+        self.columnconfigure(0, weight=1)
+        self.rowconfigure(1, weight=1)
+        self.bind("<Destroy>", self.on_destroy)
+
+        self.load_estimates()
+
+    def submit(self, job):
+        """Queue a job for this view's background worker"""
+        if self.worker is None:
+            self.worker = start_stats_worker(self.db_params, self.jobs, self.results, self.cancel)
+        self.jobs.put(job)
+        if self.poll_id is None:
+            self.poll_id = self.after(100, self.poll_results)
+
+    def load_estimates(self, refresh=False):
+        """Show cached estimates, fetching them in the background if needed"""
+        cached = None if refresh else self.cache.get_estimates(self.schema)
+        if cached is not None:
+            self.show_estimates(*cached)
+            return
+        if self.loading:
+            return
+        self.loading = True
+        self.status_label.configure(text=f"{self.schema}: loading estimates...")
+        self.submit(("estimates", self.schema, refresh))
+
+    def show_estimates(self, fetched_at, stats):
+        """Fill the Treeview with a set of estimates"""
+        self.tree.delete(*self.tree.get_children())
+        for stat in stats:
+            self.tree.insert("", "end", iid=stat["table"], text=stat["table"], values=self.format_row(stat))
+        self.status_label.configure(
+            text=f"{self.schema}: {len(stats)} tables, estimates as of {time.strftime('%H:%M:%S', time.localtime(fetched_at))}")
+
+    def format_row(self, stat):
+        """Format a statistics row for the Treeview"""
+        def percent(value):
+            return "" if value is None else f"{value:.1f}"
+
+        exact, counted_at = "", ""
+        cached = self.cache.get_exact(self.schema, stat["table"])
+        if stat["table"] in self.pending:
+            exact = "counting..."
+        elif cached is not None:
+            counted_at = time.strftime("%H:%M:%S", time.localtime(cached[0]))
+            exact = f"{cached[1]:,}"
+
+        return (
+            stat["engine"] or "",
+            "" if stat["rows"] is None else f"~{stat['rows']:,}",
+            format_bytes(stat["data_length"]),
+            format_bytes(stat["index_length"]),
+            format_bytes(stat["data_free"]),
+            percent(stat["fragmentation"]),
+            percent(stat["auto_increment_used"]),
+            exact,
+            counted_at,
+        )
+
+    def count_selected(self):
+        """Start exact counts for the selected tables in the background"""
+        selection = self.tree.selection()
+        if not selection:
+            messagebox.showerror("Error", "No table selected")
+            return
+        for table in selection:
+            if table in self.pending:
+                continue
+            self.pending.add(table)
+            self.tree.set(table, "exact", "counting...")
+            self.submit(("count", self.schema, table))
+
+    def poll_results(self):
+        """Apply finished jobs from the background worker"""
+        self.poll_id = None
+        while True:
+            try:
+                job, value, err = self.results.get_nowait()
+            except queue.Empty:
+                break
+            if job[0] == "estimates":
+                self.loading = False
+                if err is not None:
+                    self.status_label.configure(text=f"{self.schema}: failed to load estimates")
+                    messagebox.showerror("Error", f"Error fetching table statistics: {err}")
+                else:
+                    self.cache.set_estimates(self.schema, value)
+                    self.show_estimates(*self.cache.get_estimates(self.schema))
+                continue
+            _, schema, table = job
+            count = value
+            self.pending.discard(table)
+            if not self.tree.exists(table):
+                continue
+            if err is not None:
+                self.tree.set(table, "exact", "error")
+                messagebox.showerror("Error", f"Error counting rows in {table}: {err}")
+            elif count is not None:
+                self.cache.set_exact(schema, table, count)
+                self.tree.set(table, "exact", f"{count:,}")
+                self.tree.set(table, "counted_at", time.strftime("%H:%M:%S"))
+        if self.pending or self.loading:
+            self.poll_id = self.after(100, self.poll_results)
+
+    def on_destroy(self, event):
+        """Stop polling and the background worker when the view closes"""
+        if event.widget is not self:
+            return
+        self.cancel.set()
+        self.jobs.put(None)
+        if self.poll_id is not None:
+            self.after_cancel(self.poll_id)
+            self.poll_id = None